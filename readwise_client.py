@@ -3,14 +3,34 @@ Readwise API client for Python FastMCP server
 Port of the TypeScript readwise-client.ts to Python
 """
 
+import heapq
 import os
+import random
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import wraps
 import time
 
+try:
+    import ijson
+except ImportError:
+    # Fallback to buffered JSON decoding if ijson is unavailable
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib JSON decoding if orjson is unavailable
+    orjson = None
+
 @dataclass
 class ReadwiseDocument:
     id: str
@@ -96,7 +116,93 @@ class SearchHighlightsResult:
     score: int
     matched_fields: List[str]
 
+# Bit flags used by search_highlights to accumulate matched fields without
+# allocating a list + set per scored highlight
+_F_TITLE, _F_AUTHOR, _F_TEXT, _F_NOTE, _F_TAGS = 1, 2, 4, 8, 16
+_FIELD_NAMES = (
+    (_F_TITLE, 'document_title'),
+    (_F_AUTHOR, 'document_author'),
+    (_F_TEXT, 'highlight_text'),
+    (_F_NOTE, 'highlight_note'),
+    (_F_TAGS, 'highlight_tags'),
+)
+
+# The client-side response cache honors the same switch as the server cache:
+# READWISE_CACHE_TTL=0 disables caching at both layers
+_CACHE_ENABLED = int(os.getenv('READWISE_CACHE_TTL', '300')) > 0
+
+class RateLimitError(Exception):
+    """Raised when the Readwise API responds with 429"""
+    def __init__(self, retry_after: int):
+        super().__init__(f'RATE_LIMIT:{retry_after}')
+        self.retry_after = retry_after
+
+class _TokenBucket:
+    """Process-wide request admission so concurrent callers pace themselves
+    under the Readwise rate limit instead of all slamming into a 429.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; a
+    429's Retry-After pauses the whole bucket (with a little jitter so
+    waiting threads don't all wake at once).
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._pause_until:
+                    self._tokens = min(
+                        self.capacity,
+                        self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._pause_until - now
+            time.sleep(wait)
+
+    def pause(self, retry_after: int):
+        with self._lock:
+            self._pause_until = max(
+                self._pause_until,
+                time.monotonic() + retry_after + random.uniform(0, 1)
+            )
+
+def _handle_rate_limit(func):
+    """Translate RateLimitError into the user-facing rate-limit message"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except RateLimitError as error:
+            raise Exception(
+                f"Rate limit exceeded. Too many requests. "
+                f"Please retry after {error.retry_after} seconds."
+            )
+    return wrapper
+
 class ReadwiseClient:
+    # TTLs (seconds) for the bulk read endpoints; tags barely change,
+    # exports/books change as the user reads
+    TAGS_CACHE_TTL = 3600
+    EXPORT_CACHE_TTL = 300
+    BOOKS_CACHE_TTL = 300
+    # Bound on distinct cached responses; export/books entries can be
+    # megabytes each, so evict least-recently-used rather than pinning
+    # every param combination for the life of the process
+    CACHE_MAX_ENTRIES = 64
+
     def __init__(self, token: str):
         self.token = token
         self.base_url = 'https://readwise.io/api/v3'
@@ -105,36 +211,84 @@ class ReadwiseClient:
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'Token {token}',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
-
-    def _make_request(self, endpoint: str, method: str = 'GET', data: Optional[Dict] = None, use_v2_api: bool = False) -> Dict:
+        # Widen the connection pool so concurrent calls don't block on pool
+        # checkout, and let urllib3 retry transient 5xx responses for us.
+        # 429 is deliberately excluded: rate limits are surfaced to callers.
+        # Only idempotent methods are retried - re-sending a POST/PATCH whose
+        # response was lost after the server committed would duplicate
+        # documents or highlights
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'DELETE'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        # Response cache for expensive read endpoints: key -> (fetched_at,
+        # response). Bounded LRU, oldest entries evicted first
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # Two pools so a task never blocks on futures queued to its own
+        # pool: _executor runs orchestrating methods (which wait on page
+        # fetches), _page_executor runs only leaf requests that never
+        # submit. One shared pool deadlocks once every worker holds a
+        # blocked parent whose children can't be scheduled.
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._page_executor = ThreadPoolExecutor(max_workers=8)
+        # Readwise allows ~20 requests/minute; admit requests at that rate
+        # with a burst of 20 so concurrent callers rarely see a 429 at all
+        self._limiter = _TokenBucket(rate=20 / 60.0, capacity=20)
+
+    def close(self):
+        """Release pooled HTTP connections and worker threads"""
+        self._executor.shutdown(wait=False)
+        self._page_executor.shutdown(wait=False)
+        self.session.close()
+
+    def _make_request(self, endpoint: str, method: str = 'GET', data: Optional[Dict] = None,
+                      params: Optional[Dict] = None, use_v2_api: bool = False) -> Dict:
         """Make HTTP request to Readwise API"""
         base_url = self.v2_base_url if use_v2_api else self.base_url
-        
+
         if endpoint.startswith('http'):
             url = endpoint
         else:
             url = f"{base_url}{endpoint}"
-        
+
+        self._limiter.acquire()
+
         try:
             if method == 'GET':
-                response = self.session.get(url)
+                response = self.session.get(url, params=params)
             elif method == 'POST':
-                response = self.session.post(url, json=data)
+                response = self.session.post(url, json=data, params=params)
             elif method == 'PATCH':
-                response = self.session.patch(url, json=data)
+                response = self.session.patch(url, json=data, params=params)
             elif method == 'DELETE':
-                response = self.session.delete(url)
-            
+                response = self.session.delete(url, params=params)
+
             if response.status_code == 429:
                 retry_after = response.headers.get('Retry-After', '60')
-                retry_after_seconds = int(retry_after)
-                raise Exception(f'RATE_LIMIT:{retry_after_seconds}')
-            
+                # Hold other in-flight callers back too; without this every
+                # concurrent request burns a round-trip on its own 429
+                self._limiter.pause(int(retry_after))
+                raise RateLimitError(int(retry_after))
+
             response.raise_for_status()
-            return response.json() if response.content else {}
-            
+            if not response.content:
+                return {}
+            # orjson decodes megabyte-scale bodies (export, full-content
+            # listings) several times faster than the stdlib parser
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+
         except requests.exceptions.HTTPError as e:
             error_text = response.text if 'response' in locals() else str(e)
             raise Exception(f"Readwise API error: {response.status_code if 'response' in locals() else 'Unknown'} - {error_text}")
@@ -148,194 +302,177 @@ class ReadwiseClient:
     def _create_error_message(self, content: str) -> APIMessage:
         return APIMessage(type='error', content=content)
 
+    def _cached(self, key: str, ttl: float, fetch) -> APIResponse:
+        """Return a cached response for key if fresh, otherwise fetch and store it"""
+        if not _CACHE_ENABLED:
+            return fetch()
+        entry = self._cache.get(key)
+        now = time.time()
+        if entry and now - entry[0] < ttl:
+            self._cache.move_to_end(key)
+            return entry[1]
+        value = fetch()
+        self._cache[key] = (now, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return value
+
+    def _invalidate(self, *prefixes: str):
+        """Drop cached responses whose key starts with any of the prefixes.
+
+        Called by the write methods so stale reads can't outlive a write:
+        the server layer invalidates its own cache and refetches, and
+        without this the refetch would be served from here instead of the
+        API.
+        """
+        for key in [k for k in self._cache if k.startswith(prefixes)]:
+            self._cache.pop(key, None)
+
     # ========== READER API METHODS (v3) ==========
 
+    @_handle_rate_limit
     def validate_auth(self) -> APIResponse:
         """Validate authentication"""
-        try:
-            result = self._make_request(self.auth_url)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        result = self._make_request(self.auth_url)
+        return self._create_response(result)
 
-    def create_document(self, url: str, html: Optional[str] = None, tags: Optional[List[str]] = None, 
+    @_handle_rate_limit
+    def create_document(self, url: str, html: Optional[str] = None, tags: Optional[List[str]] = None,
                        location: str = 'new', category: Optional[str] = None) -> APIResponse:
         """Save a document to Readwise Reader"""
-        try:
-            data = {'url': url}
-            if html:
-                data['html'] = html
-            if tags:
-                data['tags'] = tags
-            if location:
-                data['location'] = location
-            if category:
-                data['category'] = category
-                
-            result = self._make_request('/save/', method='POST', data=data)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
-
+        data = {'url': url}
+        if html:
+            data['html'] = html
+        if tags:
+            data['tags'] = tags
+        if location:
+            data['location'] = location
+        if category:
+            data['category'] = category
+
+        result = self._make_request('/save/', method='POST', data=data)
+        # Saving can introduce new tags
+        self._invalidate('/tags/')
+        return self._create_response(result)
+
+    @_handle_rate_limit
     def list_documents(self, **params) -> APIResponse:
         """List documents with optional filtering"""
-        try:
-            # Extract client-side parameters
-            limit = params.pop('limit', None)
-            content_max_length = params.pop('contentMaxLength', None)
-            content_start_offset = params.pop('contentStartOffset', None)
-            content_filter_keywords = params.pop('contentFilterKeywords', None)
-            
-            # Handle withFullContent performance warnings
-            if params.get('withFullContent'):
-                # First check document count
-                count_params = {k: v for k, v in params.items() if k not in ['withFullContent', 'withHtmlContent']}
-                
-                query_params = []
-                for key, value in count_params.items():
-                    if value is not None:
-                        query_params.append(f"{key}={value}")
-                
-                query_string = '&'.join(query_params)
-                count_endpoint = f"/list/{'?' + query_string if query_string else ''}"
-                
-                count_response = self._make_request(count_endpoint)
-                
-                user_limit = limit or 5
-                if count_response['count'] > user_limit:
-                    # Get limited documents with full content
-                    query_params = []
-                    for key, value in params.items():
-                        if value is not None:
-                            query_params.append(f"{key}={value}")
-                    
-                    query_string = '&'.join(query_params)
-                    endpoint = f"/list/{'?' + query_string if query_string else ''}"
-                    
-                    result = self._make_request(endpoint)
-                    
-                    # Apply client-side limit
-                    limited_results = result['results'][:user_limit]
-                    limited_response = {
-                        **result,
-                        'results': limited_results,
-                        'count': len(limited_results)
-                    }
-                    
-                    if count_response['count'] <= 20:
-                        message = self._create_info_message(
-                            f"Found {count_response['count']} documents, but only returning the first {user_limit} due to full content request. "
-                            f"To get the remaining {count_response['count'] - user_limit} documents with full content, "
-                            f"you can fetch them individually by their IDs using the update/read document API."
-                        )
-                    else:
-                        message = self._create_error_message(
-                            f"Found {count_response['count']} documents, but only returning the first {user_limit} due to full content request. "
-                            f"Getting full content for more than 20 documents is not supported due to performance limitations."
-                        )
-                    
-                    return self._create_response(limited_response, [message])
-
-            # Regular request
-            query_params = []
-            for key, value in params.items():
-                if value is not None:
-                    query_params.append(f"{key}={value}")
-            
-            query_string = '&'.join(query_params)
-            endpoint = f"/list/{'?' + query_string if query_string else ''}"
-            
-            result = self._make_request(endpoint)
-            
-            # Apply client-side limit if specified
-            if limit and limit > 0:
-                limited_results = result['results'][:limit]
-                limited_response = {
-                    **result,
-                    'results': limited_results,
-                    'count': len(limited_results)
-                }
-                return self._create_response(limited_response)
-            
+        # Extract client-side parameters
+        limit = params.pop('limit', None)
+        content_max_length = params.pop('contentMaxLength', None)
+        content_start_offset = params.pop('contentStartOffset', None)
+        content_filter_keywords = params.pop('contentFilterKeywords', None)
+
+        # Handle withFullContent performance warnings. The listing response
+        # itself carries the total count, so no preflight count request is
+        # needed - one round-trip decides both the data and the warning.
+        if params.get('withFullContent'):
+            user_limit = limit or 5
+            query = {k: v for k, v in params.items() if v is not None}
+            result = self._make_request('/list/', params=query)
+
+            total_count = result.get('count', 0)
+            if total_count > user_limit:
+                # Apply client-side limit in place; result is a freshly
+                # decoded dict so there are no aliasing concerns
+                result['results'] = result['results'][:user_limit]
+                result['count'] = len(result['results'])
+
+                if total_count <= 20:
+                    message = self._create_info_message(
+                        f"Found {total_count} documents, but only returning the first {user_limit} due to full content request. "
+                        f"To get the remaining {total_count - user_limit} documents with full content, "
+                        f"you can fetch them individually by their IDs using the update/read document API."
+                    )
+                else:
+                    message = self._create_error_message(
+                        f"Found {total_count} documents, but only returning the first {user_limit} due to full content request. "
+                        f"Getting full content for more than 20 documents is not supported due to performance limitations."
+                    )
+
+                return self._create_response(result, [message])
+
             return self._create_response(result)
-            
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
 
+        # Regular request
+        query = {k: v for k, v in params.items() if v is not None}
+        result = self._make_request('/list/', params=query)
+
+        # Apply client-side limit if specified
+        if limit and limit > 0:
+            result['results'] = result['results'][:limit]
+            result['count'] = len(result['results'])
+
+        return self._create_response(result)
+
+    @_handle_rate_limit
     def update_document(self, document_id: str, **data) -> APIResponse:
         """Update document metadata"""
-        try:
-            result = self._make_request(f'/update/{document_id}/', method='PATCH', data=data)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        result = self._make_request(f'/update/{document_id}/', method='PATCH', data=data)
+        # Updates can add or rename tags
+        self._invalidate('/tags/')
+        return self._create_response(result)
 
+    @_handle_rate_limit
     def delete_document(self, document_id: str) -> APIResponse:
         """Delete a document"""
-        try:
-            self._make_request(f'/delete/{document_id}/', method='DELETE')
-            return self._create_response(None)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        self._make_request(f'/delete/{document_id}/', method='DELETE')
+        # Deleting may retire the last document carrying a tag
+        self._invalidate('/tags/')
+        return self._create_response(None)
 
+    @_handle_rate_limit
     def list_tags(self) -> APIResponse:
         """List all document tags"""
-        try:
+        def fetch():
             result = self._make_request('/tags/')
             return self._create_response(result['results'])
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        return self._cached('/tags/', self.TAGS_CACHE_TTL, fetch)
 
+    @_handle_rate_limit
     def search_documents_by_topic(self, search_terms: List[str]) -> APIResponse:
         """Search documents by topic using regex patterns"""
-        try:
-            # Fetch all documents without full content for performance
-            all_documents = []
-            next_page_cursor = None
-            
-            while True:
-                params = {
-                    'withFullContent': False,
-                    'withHtmlContent': False,
-                }
-                
-                if next_page_cursor:
-                    params['pageCursor'] = next_page_cursor
-                
-                response = self.list_documents(**params)
-                all_documents.extend(response.data['results'])
-                next_page_cursor = response.data.get('nextPageCursor')
-                
-                if not next_page_cursor:
-                    break
-
-            # Create regex patterns from search terms (case-insensitive)
-            regex_patterns = []
-            for term in search_terms:
-                escaped_term = re.escape(term)
-                regex_patterns.append(re.compile(escaped_term, re.IGNORECASE))
-
-            # Filter documents that match any of the search terms
-            matching_documents = []
-            for doc in all_documents:
+        # No terms means no matches; without this guard the joined pattern
+        # would be empty and match every document in the library
+        if not search_terms:
+            return self._create_response([])
+
+        # Fetch all documents without full content for performance.
+        # Cursor pagination is inherently serial (each page reveals the next
+        # cursor), so overlap what we can: as soon as a page's cursor is
+        # known, the next fetch is submitted to the executor while the
+        # current page is processed on this thread.
+        # Combine all search terms into one case-insensitive alternation so
+        # the regex engine makes a single pass per document
+        combined_pattern = re.compile(
+            '|'.join(re.escape(term) for term in search_terms),
+            re.IGNORECASE
+        )
+
+        # Filter each page as it arrives so only matches are retained instead
+        # of buffering the whole library before scanning it
+        matching_documents = []
+        future = self._page_executor.submit(
+            self.list_documents, withFullContent=False, withHtmlContent=False
+        )
+
+        while future is not None:
+            response = future.result()
+            next_page_cursor = response.data.get('nextPageCursor')
+
+            if next_page_cursor:
+                future = self._page_executor.submit(
+                    self.list_documents,
+                    withFullContent=False,
+                    withHtmlContent=False,
+                    pageCursor=next_page_cursor
+                )
+            else:
+                future = None
+
+            for doc in response.data['results']:
                 # Extract searchable text fields
                 searchable_fields = [
                     doc.get('title', ''),
@@ -345,224 +482,264 @@ class ReadwiseClient:
                     ' '.join(doc.get('tags', [])) if isinstance(doc.get('tags'), list) else '',
                 ]
 
-                searchable_text = ' '.join(searchable_fields).lower()
+                searchable_text = ' '.join(searchable_fields)
 
-                # Check if any regex pattern matches
-                if any(pattern.search(searchable_text) for pattern in regex_patterns):
+                if combined_pattern.search(searchable_text):
                     matching_documents.append(doc)
 
-            return self._create_response(matching_documents)
-            
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        return self._create_response(matching_documents)
 
     # ========== HIGHLIGHTS API METHODS (v2) ==========
 
+    @_handle_rate_limit
     def list_highlights(self, **params) -> APIResponse:
         """List highlights with filtering"""
-        try:
-            query_params = []
-            for key, value in params.items():
-                if value is not None:
-                    query_params.append(f"{key}={value}")
-            
-            query_string = '&'.join(query_params)
-            endpoint = f"/highlights/{'?' + query_string if query_string else ''}"
-            
-            result = self._make_request(endpoint, use_v2_api=True)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        query = {k: v for k, v in params.items() if v is not None}
+        result = self._make_request('/highlights/', params=query, use_v2_api=True)
+        return self._create_response(result)
 
+    @_handle_rate_limit
     def create_highlight(self, highlights: List[Dict]) -> APIResponse:
         """Create highlights manually"""
-        try:
-            data = {'highlights': highlights}
-            result = self._make_request('/highlights/', method='POST', data=data, use_v2_api=True)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        data = {'highlights': highlights}
+        result = self._make_request('/highlights/', method='POST', data=data, use_v2_api=True)
+        # New highlights change book counts and export contents
+        self._invalidate('/books/', '/export/')
+        return self._create_response(result)
 
+    @_handle_rate_limit
     def export_highlights(self, **params) -> APIResponse:
         """Export highlights for backup/analysis"""
-        try:
-            query_params = []
-            for key, value in params.items():
-                if value is not None:
-                    query_params.append(f"{key}={value}")
-            
-            query_string = '&'.join(query_params)
-            endpoint = f"/export/{'?' + query_string if query_string else ''}"
-            
-            result = self._make_request(endpoint, use_v2_api=True)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        query = {k: v for k, v in params.items() if v is not None}
+        cache_key = f"/export/?{sorted(query.items())}"
 
+        def fetch():
+            result = self._make_request('/export/', params=query, use_v2_api=True)
+            return self._create_response(result)
+        return self._cached(cache_key, self.EXPORT_CACHE_TTL, fetch)
+
+    def iter_export_books(self):
+        """Yield books from /export/ one at a time.
+
+        With ijson installed the body is decoded while it is still streaming
+        over HTTP, so peak memory stays at one book instead of the whole
+        export. Without it, falls back to the (cached) buffered export.
+        """
+        if ijson is None:
+            yield from self.export_highlights().data['results']
+            return
+
+        # The streaming GET bypasses _make_request, so it must go through
+        # the same admission and 429 handling itself
+        self._limiter.acquire()
+        response = self.session.get(f"{self.v2_base_url}/export/", stream=True)
+        if response.status_code == 429:
+            retry_after = int(response.headers.get('Retry-After', '60'))
+            self._limiter.pause(retry_after)
+            raise RateLimitError(retry_after)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'results.item')
+
+    @_handle_rate_limit
     def get_daily_review(self) -> APIResponse:
         """Get daily review highlights for spaced repetition"""
-        try:
-            result = self._make_request('/review/', use_v2_api=True)
-            return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        result = self._make_request('/review/', use_v2_api=True)
+        return self._create_response(result)
 
+    @_handle_rate_limit
     def list_books(self, **params) -> APIResponse:
         """List books with metadata"""
-        try:
-            query_params = []
-            for key, value in params.items():
-                if value is not None:
-                    query_params.append(f"{key}={value}")
-            
-            query_string = '&'.join(query_params)
-            endpoint = f"/books/{'?' + query_string if query_string else ''}"
-            
-            result = self._make_request(endpoint, use_v2_api=True)
+        query = {k: v for k, v in params.items() if v is not None}
+        cache_key = f"/books/?{sorted(query.items())}"
+
+        def fetch():
+            result = self._make_request('/books/', params=query, use_v2_api=True)
             return self._create_response(result)
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
+        return self._cached(cache_key, self.BOOKS_CACHE_TTL, fetch)
 
+    @_handle_rate_limit
     def get_book_highlights(self, book_id: int) -> APIResponse:
         """Get all highlights from a specific book"""
-        try:
-            result = self.list_highlights(book_id=book_id, page_size=1000)
-            return self._create_response(result.data['results'])
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
-
-    def search_highlights(self, text_query: Optional[str] = None, field_queries: Optional[List[Dict]] = None, 
+        result = self.list_highlights(book_id=book_id, page_size=1000)
+        highlights = result.data['results']
+
+        # The v2 highlights list is numbered-page paginated, so once the
+        # first page reports the total count the remaining pages can be
+        # fetched concurrently instead of walking them one at a time
+        count = result.data.get('count', len(highlights))
+        if count > len(highlights) and highlights:
+            page_size = len(highlights)
+            total_pages = -(-count // page_size)
+            futures = [
+                self._page_executor.submit(
+                    self.list_highlights,
+                    book_id=book_id, page_size=page_size, page=page
+                )
+                for page in range(2, total_pages + 1)
+            ]
+            for future in futures:
+                highlights.extend(future.result().data['results'])
+
+        return self._create_response(highlights)
+
+    @_handle_rate_limit
+    def search_highlights(self, text_query: Optional[str] = None, field_queries: Optional[List[Dict]] = None,
                          book_id: Optional[int] = None, limit: Optional[int] = None) -> APIResponse:
         """Advanced search across highlights with scoring"""
-        try:
-            results = []
-            
-            # Strategy: Use export API for comprehensive search across all data
-            export_response = self.export_highlights()
-            books = export_response.data['results']
-            
-            # Search through exported data
-            for book in books:
-                # Filter by bookId if specified
-                if book_id and book['id'] != book_id:
-                    continue
-                
-                for highlight in book['highlights']:
-                    score = 0
-                    matched_fields = []
-                    
-                    # Text query search (main search term)
-                    if text_query:
-                        query = text_query.lower()
-                        if query in highlight['text'].lower():
+        results = []
+        # With a limit, keep a bounded min-heap of the top scores instead of
+        # collecting and sorting everything; the counter breaks score ties in
+        # insertion order so ranking matches the full sort
+        heap = []
+        counter = 0
+
+        if book_id:
+            # Scoped search: fetch just that book's highlights and metadata
+            # server-side instead of downloading the full export. The
+            # one-shot detail request runs on the leaf pool while the
+            # highlights fan-out happens on this thread, so this method can
+            # itself run on _executor without nesting into it
+            detail_future = self._page_executor.submit(
+                self._make_request, f'/books/{book_id}/', use_v2_api=True
+            )
+            highlights = self.get_book_highlights(book_id)
+            book_detail = detail_future.result()
+            book_detail['highlights'] = highlights.data
+            books = [book_detail]
+        else:
+            # Strategy: stream the export so each book is scored and
+            # discarded before the next one is decoded
+            books = self.iter_export_books()
+
+        # Build one alternation over every needle (text query plus all
+        # field-query terms) so non-matching highlights are rejected with a
+        # single C-level scan instead of one substring probe per term/field
+        needles = []
+        if text_query:
+            needles.append(text_query)
+        if field_queries:
+            needles.extend(fq['searchTerm'] for fq in field_queries)
+        prefilter = re.compile(
+            '|'.join(re.escape(n) for n in needles), re.IGNORECASE
+        ) if needles else None
+
+        # Lowercase the query terms once, not per highlight
+        query = text_query.lower() if text_query else None
+        field_terms = [
+            (fq['field'], fq['searchTerm'].lower()) for fq in field_queries
+        ] if field_queries else None
+
+        # Search through exported data
+        for book in books:
+            # Book-level fields are the same for every highlight
+            title_l = book['title'].lower()
+            author_l = book['author'].lower()
+            # Book-level hit means every highlight is a candidate
+            book_hit = bool(prefilter.search(f"{book['title']} {book['author']}")) if prefilter else True
+            for highlight in book['highlights']:
+                if prefilter and not book_hit:
+                    tags_text = ' '.join(t['name'] for t in highlight.get('tags', []))
+                    if not prefilter.search(
+                        f"{highlight['text']} {highlight.get('note') or ''} {tags_text}"
+                    ):
+                        continue
+                # Lowercase each highlight field once for all query terms
+                text_l = highlight['text'].lower()
+                note_l = highlight['note'].lower() if highlight.get('note') else None
+                score = 0
+                matched = 0
+
+                # Text query search (main search term)
+                if query:
+                    if query in text_l:
+                        score += 10
+                        matched |= _F_TEXT
+                    if note_l and query in note_l:
+                        score += 8
+                        matched |= _F_NOTE
+                    if query in title_l:
+                        score += 6
+                        matched |= _F_TITLE
+                    if query in author_l:
+                        score += 4
+                        matched |= _F_AUTHOR
+
+                # Field-specific queries
+                if field_terms:
+                    for field, search_term in field_terms:
+                        if field == 'document_title' and search_term in title_l:
+                            score += 8
+                            matched |= _F_TITLE
+                        elif field == 'document_author' and search_term in author_l:
+                            score += 8
+                            matched |= _F_AUTHOR
+                        elif field == 'highlight_text' and search_term in text_l:
                             score += 10
-                            matched_fields.append('highlight_text')
-                        if highlight.get('note') and query in highlight['note'].lower():
+                            matched |= _F_TEXT
+                        elif field == 'highlight_note' and note_l and search_term in note_l:
                             score += 8
-                            matched_fields.append('highlight_note')
-                        if query in book['title'].lower():
-                            score += 6
-                            matched_fields.append('document_title')
-                        if query in book['author'].lower():
-                            score += 4
-                            matched_fields.append('document_author')
-                    
-                    # Field-specific queries
-                    if field_queries:
-                        for field_query in field_queries:
-                            search_term = field_query['searchTerm'].lower()
-                            field = field_query['field']
-                            
-                            if field == 'document_title' and search_term in book['title'].lower():
-                                score += 8
-                                matched_fields.append('document_title')
-                            elif field == 'document_author' and search_term in book['author'].lower():
-                                score += 8
-                                matched_fields.append('document_author')
-                            elif field == 'highlight_text' and search_term in highlight['text'].lower():
-                                score += 10
-                                matched_fields.append('highlight_text')
-                            elif field == 'highlight_note' and highlight.get('note') and search_term in highlight['note'].lower():
-                                score += 8
-                                matched_fields.append('highlight_note')
-                            elif field == 'highlight_tags':
-                                for tag in highlight.get('tags', []):
-                                    if search_term in tag['name'].lower():
-                                        score += 6
-                                        matched_fields.append('highlight_tags')
-                                        break
-                    
-                    # If we have matches, add to results
-                    if score > 0:
-                        book_without_highlights = {k: v for k, v in book.items() if k != 'highlights'}
-                        results.append({
-                            'highlight': highlight,
-                            'book': book_without_highlights,
-                            'score': score,
-                            'matched_fields': list(set(matched_fields))  # Remove duplicates
-                        })
-            
-            # Sort by score and apply limit
+                            matched |= _F_NOTE
+                        elif field == 'highlight_tags':
+                            for tag in highlight.get('tags', []):
+                                if search_term in tag['name'].lower():
+                                    score += 6
+                                    matched |= _F_TAGS
+                                    break
+
+                # If we have matches, add to results
+                if score > 0:
+                    if limit and len(heap) >= limit and score <= heap[0][0]:
+                        # Cannot enter the top-K; skip building the payload
+                        continue
+                    book_without_highlights = {k: v for k, v in book.items() if k != 'highlights'}
+                    entry = {
+                        'highlight': highlight,
+                        'book': book_without_highlights,
+                        'score': score,
+                        'matched_fields': [name for bit, name in _FIELD_NAMES if matched & bit]
+                    }
+                    if limit:
+                        counter += 1
+                        heapq.heappush(heap, (score, -counter, entry))
+                        if len(heap) > limit:
+                            heapq.heappop(heap)
+                    else:
+                        results.append(entry)
+
+        # Emit in descending score order (ties keep insertion order)
+        if limit:
+            results = [e[2] for e in sorted(heap, key=lambda x: (-x[0], -x[1]))]
+        else:
             results.sort(key=lambda x: x['score'], reverse=True)
-            if limit:
-                results = results[:limit]
-            
-            return self._create_response(results)
-            
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
 
+        return self._create_response(results)
+
+    @_handle_rate_limit
     def search_documents_and_highlights(self, search_terms: List[str]) -> APIResponse:
         """Enhanced topic search that includes both documents and highlights"""
-        try:
-            # Get documents (existing functionality)
-            documents_response = self.search_documents_by_topic(search_terms)
-            
-            # Search highlights using the same terms
-            highlights_response = self.search_highlights(
-                text_query=' '.join(search_terms),
-                limit=50
-            )
-            
-            # Get relevant books
-            book_ids = list(set([result['book']['id'] for result in highlights_response.data]))
-            books_response = self.list_books(page_size=min(len(book_ids), 100))
-            relevant_books = [book for book in books_response.data['results'] if book['id'] in book_ids]
-            
-            results = {
-                'documents': documents_response.data,
-                'highlights': highlights_response.data,
-                'books': relevant_books
-            }
-            
-            return self._create_response(results)
-            
-        except Exception as error:
-            if str(error).startswith('RATE_LIMIT:'):
-                seconds = int(str(error).split(':')[1])
-                raise Exception(f"Rate limit exceeded. Too many requests. Please retry after {seconds} seconds.")
-            raise error
\ No newline at end of file
+        # Documents and highlights are independent - run them concurrently
+        # so wall time is the max of the two instead of the sum
+        documents_future = self._executor.submit(
+            self.search_documents_by_topic, search_terms
+        )
+        highlights_future = self._executor.submit(
+            self.search_highlights,
+            text_query=' '.join(search_terms),
+            limit=50
+        )
+        documents_response = documents_future.result()
+        highlights_response = highlights_future.result()
+
+        # Get relevant books (depends on the highlight results)
+        book_ids = list(set([result['book']['id'] for result in highlights_response.data]))
+        books_response = self.list_books(page_size=min(len(book_ids), 100))
+        relevant_books = [book for book in books_response.data['results'] if book['id'] in book_ids]
+
+        results = {
+            'documents': documents_response.data,
+            'highlights': highlights_response.data,
+            'books': relevant_books
+        }
+
+        return self._create_response(results)
@@ -5,14 +5,23 @@ A comprehensive MCP server combining Readwise Reader + Highlights functionality
 Ported from TypeScript to Python for FastMCP Cloud deployment
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
 import os
+import random
 import re
+import threading
 import time
+from bisect import bisect_right
+from collections import OrderedDict
 from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import List, Dict, Any, Optional, Union
-import wordninja
 from fastmcp import FastMCP, Context
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from readwise_client import ReadwiseClient
 try:
     from mcp.types import ToolAnnotations
@@ -20,8 +29,41 @@ except ImportError:
     # Fallback if annotations not available
     ToolAnnotations = None
 
+try:
+    import ahocorasick
+except ImportError:
+    # Fallback to the compiled regex alternation for keyword filtering
+    ahocorasick = None
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    # Fallback to difflib for fuzzy title matching
+    _rf_fuzz = _rf_process = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # Fallback to processing raw HTML if selectolax is unavailable
+    HTMLParser = None
+
+# Serialize tool results with orjson when available: considerably faster than
+# the stdlib encoder on the dict-heavy payloads these tools return
+try:
+    import orjson
+
+    def _serialize_tool_result(data: Any) -> str:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            # orjson is stricter than the stdlib encoder about input types;
+            # fall back rather than fail the tool call
+            return json.dumps(data, default=str)
+except ImportError:
+    _serialize_tool_result = None
+
 # Initialize FastMCP server
-mcp = FastMCP("Readwise MCP Enhanced")
+mcp = FastMCP("Readwise MCP Enhanced", tool_serializer=_serialize_tool_result)
 
 # Add rate limiting middleware to prevent API overload
 try:
@@ -40,45 +82,110 @@ except ImportError:
 readwise_token = os.getenv('READWISE_TOKEN')
 client = None
 
-# Simple cache for expensive operations (helps reduce API calls)
-_cache = {}
-_cache_timestamps = {}
-CACHE_TTL = 300  # 5 minutes
-
-def is_cache_valid(key: str) -> bool:
-    """Check if cached data is still valid"""
-    if key not in _cache or key not in _cache_timestamps:
-        return False
-    return (time.time() - _cache_timestamps[key]) < CACHE_TTL
+# Simple cache for expensive operations (helps reduce API calls).
+# Bounded LRU: key -> (timestamp, ttl, data), oldest entries evicted first
+_cache = OrderedDict()
+_CACHE_MAX_ENTRIES = 1024
+# Default TTL in seconds; override with READWISE_CACHE_TTL (0 disables caching)
+CACHE_TTL = int(os.getenv('READWISE_CACHE_TTL', '300'))
+
+# Per-prefix TTL tiers: books and tags barely change between sessions while
+# recent documents move by the minute. Longest matching prefix wins; keys
+# without a tier (and set_cache calls passing an explicit ttl) use CACHE_TTL
+_TTL_TIERS = {
+    "books_resource": 1800,
+    "books_lowered": 1800,
+    "tags_list": 3600,
+    "book_highlights_": 1800,
+    "search_books_": 600,
+    "recent_documents": 60,
+}
+
+def _ttl_for_key(key: str) -> int:
+    match = None
+    for prefix, ttl in _TTL_TIERS.items():
+        if key.startswith(prefix) and (match is None or len(prefix) > len(match)):
+            match, tier_ttl = prefix, ttl
+    return tier_ttl if match else CACHE_TTL
 
 def get_cached(key: str):
-    """Get cached data if valid"""
-    if is_cache_valid(key):
-        return _cache[key]
-    return None
+    """Get cached data if valid, expiring stale entries on access"""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    timestamp, ttl, data = entry
+    if (time.time() - timestamp) >= ttl:
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return data
+
+def set_cache(key: str, data, ttl: Optional[int] = None):
+    """Cache data with timestamp and optional per-key TTL"""
+    if CACHE_TTL <= 0:
+        return
+    resolved_ttl = ttl if ttl is not None else _ttl_for_key(key)
+    # Jitter expirations by up to 10% so entries written together (e.g. after
+    # a restart) don't all expire — and refetch — at the same instant
+    _cache[key] = (time.time(), resolved_ttl * (1 + random.random() * 0.1), data)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+def invalidate_cache(*prefixes: str):
+    """Drop cached entries whose key starts with any of the prefixes"""
+    for key in [k for k in _cache if k.startswith(prefixes)]:
+        _cache.pop(key, None)
+
+# Single-flight refresh: when a hot entry expires under concurrent load, only
+# one coroutine refetches it while the others wait for that result instead of
+# all hitting the Readwise API at once
+_fetch_locks: Dict[str, asyncio.Lock] = {}
+
+async def _cached_fetch(key: str, fetch, ttl: Optional[int] = None):
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+    lock = _fetch_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # A waiter that held the lock may have refreshed the entry already
+        cached = get_cached(key)
+        if cached is not None:
+            return cached
+        result = await fetch()
+        set_cache(key, result, ttl=ttl)
+        return result
 
-def set_cache(key: str, data):
-    """Cache data with timestamp"""
-    _cache[key] = data
-    _cache_timestamps[key] = time.time()
+_client_lock = threading.Lock()
 
 def get_client():
     global client
     if client is None:
-        if not readwise_token:
-            raise ValueError("READWISE_TOKEN environment variable is required")
-        client = ReadwiseClient(readwise_token)
+        # Tools run on worker threads, so double-check under a lock to avoid
+        # two racing first calls building (and leaking) separate clients
+        with _client_lock:
+            if client is None:
+                if not readwise_token:
+                    raise ValueError("READWISE_TOKEN environment variable is required")
+                client = ReadwiseClient(readwise_token)
+                atexit.register(client.close)
     return client
 
 # Pydantic models for request validation
-class SaveDocumentRequest(BaseModel):
+class RequestModel(BaseModel):
+    # Ignore unknown fields instead of failing the whole tool call; keys are
+    # whitelisted again by exclude_none dumps before reaching the client.
+    # Requests are never mutated after validation, so freeze them
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+class SaveDocumentRequest(RequestModel):
     url: str = Field(..., description="URL of the document to save")
     html: Optional[str] = Field(None, description="HTML content of the document (optional)")
     tags: Optional[List[str]] = Field(None, description="Tags to add to the document")
     location: str = Field("new", description="Location to save the document")
     category: Optional[str] = Field(None, description="Category of the document")
 
-class ListDocumentsRequest(BaseModel):
+class ListDocumentsRequest(RequestModel):
     id: Optional[str] = Field(None, description="Filter by specific document ID")
     updatedAfter: Optional[str] = Field(None, description="Filter documents updated after this date (ISO 8601)")
     addedAfter: Optional[str] = Field(None, description="Filter documents added after this date (ISO 8601)")
@@ -88,12 +195,12 @@ class ListDocumentsRequest(BaseModel):
     pageCursor: Optional[str] = Field(None, description="Page cursor for pagination")
     withHtmlContent: Optional[bool] = Field(False, description="Include HTML content (performance warning)")
     withFullContent: Optional[bool] = Field(False, description="Include full text content (performance warning)")
-    contentMaxLength: Optional[int] = Field(50000, description="Maximum content length per document")
-    contentStartOffset: Optional[int] = Field(0, description="Character offset to start content extraction")
+    contentMaxLength: Optional[int] = Field(50000, description="Maximum content length per document (applied to raw HTML before processing)")
+    contentStartOffset: Optional[int] = Field(0, description="Character offset into the raw HTML to start content extraction")
     contentFilterKeywords: Optional[List[str]] = Field(None, description="Filter content by keywords")
     limit: Optional[int] = Field(None, description="Maximum number of documents to return")
 
-class UpdateDocumentRequest(BaseModel):
+class UpdateDocumentRequest(RequestModel):
     id: str = Field(..., description="Document ID to update")
     title: Optional[str] = Field(None, description="New title")
     author: Optional[str] = Field(None, description="New author")
@@ -103,13 +210,13 @@ class UpdateDocumentRequest(BaseModel):
     location: Optional[str] = Field(None, description="New location")
     category: Optional[str] = Field(None, description="New category")
 
-class DeleteDocumentRequest(BaseModel):
+class DeleteDocumentRequest(RequestModel):
     id: str = Field(..., description="Document ID to delete")
 
-class TopicSearchRequest(BaseModel):
+class TopicSearchRequest(RequestModel):
     searchTerms: List[str] = Field(..., description="Search terms to look for")
 
-class ListHighlightsRequest(BaseModel):
+class ListHighlightsRequest(RequestModel):
     page_size: Optional[int] = Field(100, description="Number of highlights per page")
     page: Optional[int] = Field(None, description="Page number")
     book_id: Optional[int] = Field(None, description="Filter by book ID")
@@ -118,16 +225,17 @@ class ListHighlightsRequest(BaseModel):
     highlighted_at__lt: Optional[str] = Field(None, description="Highlighted before this date")
     highlighted_at__gt: Optional[str] = Field(None, description="Highlighted after this date")
 
-class CreateHighlightRequest(BaseModel):
+class CreateHighlightRequest(RequestModel):
     highlights: List[Dict[str, Any]] = Field(..., description="List of highlights to create")
 
-class ExportHighlightsRequest(BaseModel):
+class ExportHighlightsRequest(RequestModel):
     updatedAfter: Optional[str] = Field(None, description="Export highlights updated after this date")
     ids: Optional[str] = Field(None, description="Comma-separated list of highlight IDs")
     includeDeleted: Optional[bool] = Field(False, description="Include deleted highlights")
     pageCursor: Optional[str] = Field(None, description="Page cursor for pagination")
+    maxPages: Optional[int] = Field(1, description="Number of export pages to fetch and merge server-side (follows nextPageCursor)")
 
-class ListBooksRequest(BaseModel):
+class ListBooksRequest(RequestModel):
     page_size: Optional[int] = Field(100, description="Number of books per page")
     page: Optional[int] = Field(None, description="Page number")
     category: Optional[str] = Field(None, description="Filter by category")
@@ -137,43 +245,224 @@ class ListBooksRequest(BaseModel):
     last_highlight_at__lt: Optional[str] = Field(None, description="Last highlight before this date")
     last_highlight_at__gt: Optional[str] = Field(None, description="Last highlight after this date")
 
-class GetBookHighlightsRequest(BaseModel):
+class GetBookHighlightsRequest(RequestModel):
     bookId: int = Field(..., description="Book ID to get highlights from")
 
-class SearchHighlightsRequest(BaseModel):
-    textQuery: Optional[str] = Field(None, description="Main search query")
-    fieldQueries: Optional[List[Dict[str, str]]] = Field(None, description="Field-specific queries")
-    bookId: Optional[int] = Field(None, description="Filter by book ID")
+class SearchHighlightsRequest(RequestModel):
+    textQuery: Optional[str] = Field(None, serialization_alias="text_query", description="Main search query")
+    fieldQueries: Optional[List[Dict[str, str]]] = Field(None, serialization_alias="field_queries", description="Field-specific queries")
+    bookId: Optional[int] = Field(None, serialization_alias="book_id", description="Filter by book ID")
     limit: Optional[int] = Field(None, description="Maximum number of results")
 
-class FindBookIdRequest(BaseModel):
+class FindBookIdRequest(RequestModel):
     title: str = Field(..., description="Title of the book to find")
 
 # Utility functions
+
+# Shared empty tuple serialized as [] — avoids allocating a fresh list for
+# the common no-messages response
+_EMPTY = ()
+
+def _tool_annotations(title: str, *, read_only: bool = True,
+                      destructive: bool = False, idempotent: bool = True):
+    """Build ToolAnnotations for a tool decorator, or None when the mcp
+    types package doesn't provide them"""
+    if ToolAnnotations is None:
+        return None
+    return ToolAnnotations(
+        title=title,
+        readOnlyHint=read_only,
+        destructiveHint=destructive,
+        idempotentHint=idempotent
+    )
+
+_MSG_KEYS = ('type', 'content')
+_project_message = attrgetter(*_MSG_KEYS)
+
+def _dump_messages(response) -> Any:
+    """Render an APIResponse's messages for the tool payload"""
+    if not response.messages:
+        return _EMPTY
+    return [dict(zip(_MSG_KEYS, _project_message(msg))) for msg in response.messages]
+
+# Compiled once so per-document calls skip the re module's pattern-cache lookup
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Projection fields for the context-optimized listing responses, with their
+# itemgetters bound once at import
+_HIGHLIGHT_FIELDS = ('id', 'text', 'note', 'book_id')
+_project_highlight = itemgetter(*_HIGHLIGHT_FIELDS)
+_BOOK_FIELDS = ('id', 'title', 'author', 'category', 'num_highlights')
+_project_book = itemgetter(*_BOOK_FIELDS)
+
+def _highlight_row(highlight: Dict) -> Dict:
+    """Project one highlight, degrading missing fields to None rather than
+    letting one short row fail the whole page"""
+    try:
+        return dict(zip(_HIGHLIGHT_FIELDS, _project_highlight(highlight)))
+    except KeyError:
+        return {key: highlight.get(key) for key in _HIGHLIGHT_FIELDS}
+
+def _book_row(book: Dict) -> Dict:
+    """Project one book, tolerating missing fields like _highlight_row"""
+    try:
+        return dict(zip(_BOOK_FIELDS, _project_book(book)))
+    except KeyError:
+        return {key: book.get(key) for key in _BOOK_FIELDS}
+
+# A run of 26+ non-whitespace chars marks text that may need segmentation;
+# anything shorter is a plausible English word
+_LONG_RUN_RE = re.compile(r'\S{26}')
+
 def process_with_wordninja(text: str) -> str:
     """Process text with wordninja for better word segmentation"""
+    # Fast path: input that already has spaces and no run-on tokens doesn't
+    # need segmentation — this covers most real html_content and search terms
+    if ' ' in text and _LONG_RUN_RE.search(text) is None:
+        return text
+    # Only memoize short inputs (search terms, titles, fragments): identity
+    # hits on multi-KB blobs are rare and would pin them in the cache
+    if len(text) < 16000:
+        return _segment_with_wordninja(text)
+    return _segment(text)
+
+@lru_cache(maxsize=None)
+def _wordninja():
+    """Load wordninja on first use so its word-frequency model (~2MB)
+    doesn't delay server startup when no text tool is ever called"""
+    import wordninja
+    return wordninja
+
+# Upper bound on the text handed to one wordninja.split call; its DP keeps
+# candidate tables proportional to input length, so bounded chunks keep both
+# latency and memory per call flat
+_SEGMENT_CHUNK = 4096
+
+def _segment(text: str) -> str:
+    """Run the wordninja segmentation"""
     try:
-        # Split text into words and rejoin with proper spacing
-        words = wordninja.split(text)
-        return ' '.join(words)
+        if len(text) <= _SEGMENT_CHUNK:
+            # Split text into words and rejoin with proper spacing
+            return ' '.join(_wordninja().split(text))
+
+        # Segment long inputs chunk by chunk, breaking at whitespace when
+        # possible so glued words aren't cut mid-token
+        pieces = []
+        pos = 0
+        length = len(text)
+        while pos < length:
+            end = min(pos + _SEGMENT_CHUNK, length)
+            if end < length:
+                space = text.rfind(' ', pos, end)
+                if space > pos:
+                    end = space
+            pieces.append(' '.join(_wordninja().split(text[pos:end])))
+            pos = end
+        return ' '.join(pieces)
     except Exception:
         return text
 
+_segment_with_wordninja = lru_cache(maxsize=4096)(_segment)
+
+@lru_cache(maxsize=256)
+def _keyword_regex(keywords: tuple) -> re.Pattern:
+    """Compile a case-insensitive alternation matching any of the keywords"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def _keyword_automaton(keywords: tuple):
+    """Build an Aho-Corasick automaton over the lowercased keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+def _extract_with_automaton(content: str, keywords: tuple) -> str:
+    """Single-pass automaton scan, mapping hits back to sentence spans"""
+    hits = [end for end, _ in _keyword_automaton(keywords).iter(content.lower())]
+    if not hits:
+        return ''
+
+    # Sentence spans in order, so hit offsets map to sentences via bisect
+    spans = []
+    pos = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(content):
+        spans.append((pos, match.start()))
+        pos = match.end()
+    spans.append((pos, len(content)))
+
+    starts = [start for start, _ in spans]
+    matched = sorted({bisect_right(starts, hit) - 1 for hit in hits})
+
+    matching_sentences = []
+    for index in matched:
+        start, end = spans[index]
+        sentence = content[start:end].strip()
+        if sentence:
+            matching_sentences.append(sentence)
+
+    return '. '.join(matching_sentences)
+
 def extract_keywords_from_content(content: str, keywords: List[str]) -> str:
     """Extract sections containing keywords from content"""
     if not keywords:
         return content
-    
-    sentences = re.split(r'[.!?]+', content)
+
+    # With many keywords an Aho-Corasick automaton matches them all in one
+    # O(n) pass over the content; below that the alternation regex wins
+    if ahocorasick is not None and len(keywords) > 8:
+        return _extract_with_automaton(content, tuple(sorted(keywords)))
+
+    # One compiled alternation scans each sentence in a single C-level pass
+    # instead of lowercasing and probing it once per keyword
+    pattern = _keyword_regex(tuple(sorted(keywords)))
+
+    # Walk sentence boundaries with finditer and slice spans out of the
+    # original string, so no intermediate list of every sentence is built —
+    # only the matching ones are ever materialized
     matching_sentences = []
-    
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if any(keyword.lower() in sentence.lower() for keyword in keywords):
+    pos = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(content):
+        sentence = content[pos:match.start()].strip()
+        pos = match.end()
+        if sentence and pattern.search(sentence):
             matching_sentences.append(sentence)
-    
+
+    tail = content[pos:].strip()
+    if tail and pattern.search(tail):
+        matching_sentences.append(tail)
+
     return '. '.join(matching_sentences)
 
+def _html_text(html: str) -> str:
+    """Strip markup so the text-processing passes see prose instead of tags"""
+    if HTMLParser is None:
+        return html
+    try:
+        return HTMLParser(html).text(separator=' ')
+    except Exception:
+        return html
+
+def _process_doc_content(raw_content: str, keywords: Optional[List[str]],
+                         start_offset: int, max_length: Optional[int]) -> str:
+    """Slice, segment and keyword-filter one document's raw HTML content"""
+    # Explicit None check: contentMaxLength=0 is a valid (empty) window and
+    # must not fall through to returning the whole document
+    if max_length is not None:
+        raw_content = raw_content[start_offset:start_offset + max_length]
+    elif start_offset:
+        raw_content = raw_content[start_offset:]
+
+    # Dropping tags and attributes up front shrinks the input to the
+    # segmentation and keyword passes by a multiple for markup-heavy pages
+    processed_content = process_with_wordninja(_html_text(raw_content))
+
+    if keywords:
+        processed_content = extract_keywords_from_content(processed_content, keywords)
+
+    return processed_content
+
 # ========== RESOURCES (Direct Data Access) ==========
 
 @mcp.resource("readwise://books")
@@ -181,55 +470,74 @@ async def books_resource() -> Dict[str, Any]:
     """ALL BOOKS LIST - Use this FIRST to get complete books catalog and find any book ID.
     WORKFLOW: ALWAYS start here to find book ID, then use readwise://books/{book_id}/highlights"""
     try:
-        cached_books = get_cached("books_resource")
-        if cached_books is not None:
-            return cached_books
-        
-        # Get ALL books by paginating through all pages
-        all_books = []
-        page = 1
-        page_size = 1000
-        
-        while True:
-            response = get_client().list_books(page_size=page_size, page=page)
-            books_batch = response.data.get('results', [])
-            
-            if not books_batch:  # No more books
-                break
-                
-            for book in books_batch:
-                all_books.append({
-                    'id': book.get('id'),
-                    'title': book.get('title'),
-                    'author': book.get('author'),
-                    'category': book.get('category'),
-                    'num_highlights': book.get('num_highlights', 0)
-                })
-            
-            # If we got less than page_size, we're done
-            if len(books_batch) < page_size:
-                break
-                
-            page += 1
-        
-        result = {"books": all_books, "total": len(all_books)}
-        set_cache("books_resource", result)
-        return result
+        return await _cached_fetch("books_resource", _fetch_all_books)
     except Exception as e:
         return {"error": str(e)}
 
+async def _list_books_pages(client, **filters) -> List[Dict]:
+    """Fetch every matching books page; page 1 reveals the total count, so
+    the remaining numbered pages are fetched concurrently"""
+    page_size = 1000
+    first = await asyncio.to_thread(client.list_books, page_size=page_size, page=1, **filters)
+    books_raw = list(first.data.get('results', []))
+    count = first.data.get('count', len(books_raw))
+
+    if count > len(books_raw) and books_raw:
+        total_pages = -(-count // page_size)
+        pages = await asyncio.gather(*[
+            asyncio.to_thread(client.list_books, page_size=page_size, page=page, **filters)
+            for page in range(2, total_pages + 1)
+        ])
+        for page_response in pages:
+            books_raw.extend(page_response.data.get('results', []))
+
+    return books_raw
+
+async def _fetch_all_books() -> Dict[str, Any]:
+    """Fetch and project the complete books catalog.
+
+    A long-lived snapshot ("books_state") keeps the projected books by id and
+    the newest updated timestamp seen, so TTL refreshes only pull the delta
+    via updated__gt instead of re-downloading the whole catalog.
+    """
+    client = get_client()
+    state = get_cached("books_state")
+
+    if state and state.get('max_updated'):
+        books_raw = await _list_books_pages(client, updated__gt=state['max_updated'])
+        books_by_id = dict(state['by_id'])
+        max_updated = state['max_updated']
+    else:
+        books_raw = await _list_books_pages(client)
+        books_by_id = {}
+        max_updated = ''
+
+    for book in books_raw:
+        book.setdefault('num_highlights', 0)
+        books_by_id[book.get('id')] = _book_row(book)
+        updated = book.get('updated') or ''
+        if updated > max_updated:
+            max_updated = updated
+
+    # Deleted books linger until the snapshot itself expires, which caps
+    # staleness at a day while keeping refreshes delta-sized
+    set_cache("books_state", {'by_id': books_by_id, 'max_updated': max_updated}, ttl=86400)
+
+    all_books = list(books_by_id.values())
+    return {"books": all_books, "total": len(all_books)}
+
+async def _fetch_all_tags() -> Dict[str, Any]:
+    """Shared tag fetch backing both the tags resource and tool, so one
+    API call warms the cache for whichever consumer asks first"""
+    response = await asyncio.to_thread(get_client().list_tags)
+    return {"tags": response.data, "messages": _dump_messages(response)}
+
 @mcp.resource("readwise://tags")
 async def tags_resource() -> Dict[str, Any]:
     """Direct access to all document tags - cached for efficient LLM access"""
     try:
-        cached_tags = get_cached("tags_resource") 
-        if cached_tags is not None:
-            return cached_tags
-            
-        response = get_client().list_tags()
-        result = {"tags": response.data, "total": len(response.data)}
-        set_cache("tags_resource", result)
-        return result
+        shared = await _cached_fetch("tags_list", _fetch_all_tags)
+        return {"tags": shared["tags"], "total": len(shared["tags"])}
     except Exception as e:
         return {"error": str(e)}
 
@@ -238,19 +546,15 @@ async def book_highlights_resource(book_id: int) -> Dict[str, Any]:
     """Get highlights for specific book ID.
     WORKFLOW: Use readwise://books FIRST to get ALL books and find the book_id, then use this resource"""
     try:
-        cache_key = f"book_highlights_{book_id}"
-        cached = get_cached(cache_key)
-        if cached is not None:
-            return cached
-            
-        response = get_client().get_book_highlights(book_id)
-        result = {
-            "book_id": book_id,
-            "highlights": response.data,
-            "total": len(response.data) if response.data else 0
-        }
-        set_cache(cache_key, result)
-        return result
+        async def fetch():
+            response = await asyncio.to_thread(get_client().get_book_highlights, book_id)
+            return {
+                "book_id": book_id,
+                "highlights": response.data,
+                "total": len(response.data) if response.data else 0
+            }
+
+        return await _cached_fetch(f"book_highlights_{book_id}", fetch)
     except Exception as e:
         return {"error": str(e), "book_id": book_id}
 
@@ -259,25 +563,35 @@ async def search_books_resource(query: str) -> Dict[str, Any]:
     """Search specific books (has pagination limits - use readwise://books instead for full catalog).
     WORKFLOW: Use readwise://books FIRST for complete list, this only if you need filtered results"""
     try:
-        cache_key = f"search_books_{hash(query)}"
+        # Stable digest rather than built-in hash(): hash() is randomized per
+        # process, so keys wouldn't survive restarts or shared cache backends
+        query_digest = hashlib.blake2b(
+            query.strip().lower().encode(), digest_size=12
+        ).hexdigest()
+        cache_key = f"search_books_{query_digest}"
         cached = get_cached(cache_key)
         if cached is not None:
             return cached
             
-        # Get all books and filter
-        books_data = await books_resource()
-        if "error" in books_data:
-            return books_data
-            
+        # Filter against a lowered (title, author, book) index built once per
+        # catalog refresh, instead of lowercasing every title on every query
+        lowered = get_cached("books_lowered")
+        if lowered is None:
+            books_data = await books_resource()
+            if "error" in books_data:
+                return books_data
+            lowered = [
+                ((book.get('title') or '').lower(), (book.get('author') or '').lower(), book)
+                for book in books_data["books"]
+            ]
+            set_cache("books_lowered", lowered)
+
         query_lower = query.lower()
-        matching_books = []
-        
-        for book in books_data["books"]:
-            title_match = query_lower in book.get('title', '').lower()
-            author_match = query_lower in book.get('author', '').lower()
-            if title_match or author_match:
-                matching_books.append(book)
-        
+        matching_books = [
+            book for title, author, book in lowered
+            if query_lower in title or query_lower in author
+        ]
+
         result = {
             "query": query,
             "matching_books": matching_books,
@@ -292,17 +606,12 @@ async def search_books_resource(query: str) -> Dict[str, Any]:
 async def recent_documents_resource() -> Dict[str, Any]:
     """Direct access to recently added documents"""
     try:
-        cached = get_cached("recent_documents")
-        if cached is not None:
-            return cached
-            
-        response = get_client().list_documents(page_size=50)
-        result = {
-            "documents": response.data.get('results', []),
-            "total": len(response.data.get('results', []))
-        }
-        set_cache("recent_documents", result)
-        return result
+        async def fetch():
+            response = await asyncio.to_thread(get_client().list_documents, page_size=50)
+            documents = response.data.get('results', [])
+            return {"documents": documents, "total": len(documents)}
+
+        return await _cached_fetch("recent_documents", fetch)
     except Exception as e:
         return {"error": str(e)}
 
@@ -397,28 +706,27 @@ Focus on depth and connections rather than breadth."""
 @mcp.tool(
     name="readwise_save_document",
     description="Save a document (URL or HTML content) to Readwise Reader",
-    annotations=ToolAnnotations(
-        title="Save Document to Reader", 
-        readOnlyHint=False,
-        destructiveHint=False,
-        idempotentHint=False
-    ) if ToolAnnotations else None,
+    annotations=_tool_annotations("Save Document to Reader",
+                                  read_only=False, idempotent=False),
     tags=["reader", "document", "save"]
 )
-def readwise_save_document(request: SaveDocumentRequest) -> Dict[str, Any]:
+async def readwise_save_document(request: SaveDocumentRequest) -> Dict[str, Any]:
     """Save a document (URL or HTML content) to Readwise Reader"""
     try:
-        response = get_client().create_document(
+        response = await asyncio.to_thread(
+            get_client().create_document,
             url=request.url,
             html=request.html,
             tags=request.tags,
             location=request.location,
             category=request.category
         )
+        # New documents change the recent list and may introduce tags
+        invalidate_cache("recent_documents", "tags_list")
         return {
             "success": True,
             "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -426,12 +734,7 @@ def readwise_save_document(request: SaveDocumentRequest) -> Dict[str, Any]:
 @mcp.tool(
     name="readwise_list_documents",
     description="List documents from Readwise Reader with optional filtering and smart content controls. Use conservative limits to avoid rate limits.",
-    annotations=ToolAnnotations(
-        title="List Reader Documents",
-        readOnlyHint=True,
-        destructiveHint=False,
-        idempotentHint=True
-    ) if ToolAnnotations else None,
+    annotations=_tool_annotations("List Reader Documents"),
     tags=["reader", "document", "list", "search"]
 )
 async def readwise_list_documents(request: ListDocumentsRequest, ctx: Context = None) -> Dict[str, Any]:
@@ -440,56 +743,60 @@ async def readwise_list_documents(request: ListDocumentsRequest, ctx: Context =
         if ctx:
             await ctx.info("Retrieving documents from Readwise Reader...")
             
-        # Convert request to dictionary for the client
-        params = {}
-        for field, value in request.model_dump().items():
-            if value is not None:
-                params[field] = value
-        
-        response = get_client().list_documents(**params)
-        
-        # Post-process content if needed
+        # Convert request to dictionary for the client; exclude_none filters
+        # inside pydantic's serializer instead of a second Python-level pass
+        params = request.model_dump(exclude_none=True)
+
+        response = await asyncio.to_thread(get_client().list_documents, **params)
+
+        # Post-process content if needed; documents are independent, so run
+        # the slice + wordninja + keyword-filter passes concurrently instead
+        # of walking the page one document at a time
         if request.withFullContent and response.data.get('results'):
-            for doc in response.data['results']:
-                if doc.get('html_content'):
-                    # Process with wordninja for better text segmentation
-                    processed_content = process_with_wordninja(doc['html_content'])
-                    
-                    # Apply keyword filtering if specified
-                    if request.contentFilterKeywords:
-                        processed_content = extract_keywords_from_content(
-                            processed_content, 
-                            request.contentFilterKeywords
-                        )
-                    
-                    # Apply length limits
-                    if request.contentMaxLength:
-                        start_offset = request.contentStartOffset or 0
-                        end_offset = start_offset + request.contentMaxLength
-                        processed_content = processed_content[start_offset:end_offset]
-                    
+            docs = [doc for doc in response.data['results'] if doc.get('html_content')]
+            if docs:
+                start_offset = request.contentStartOffset or 0
+                processed = await asyncio.gather(*[
+                    asyncio.to_thread(
+                        _process_doc_content,
+                        doc['html_content'],
+                        request.contentFilterKeywords,
+                        start_offset,
+                        request.contentMaxLength
+                    )
+                    for doc in docs
+                ])
+                for doc, processed_content in zip(docs, processed):
                     doc['html_content'] = processed_content
+        elif response.data.get('results'):
+            # Content wasn't requested: drop the heavy fields so they aren't
+            # serialized back over the MCP transport anyway
+            for doc in response.data['results']:
+                doc.pop('content', None)
+                if not request.withHtmlContent:
+                    doc.pop('html_content', None)
         
         return {
             "success": True,
             "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_update_document(request: UpdateDocumentRequest) -> Dict[str, Any]:
+async def readwise_update_document(request: UpdateDocumentRequest) -> Dict[str, Any]:
     """Update a document in Readwise Reader"""
     try:
         doc_id = request.id
-        update_data = {k: v for k, v in request.model_dump().items() if k != 'id' and v is not None}
-        
-        response = get_client().update_document(doc_id, **update_data)
+        update_data = request.model_dump(exclude_none=True, exclude={'id'})
+
+        response = await asyncio.to_thread(get_client().update_document, doc_id, **update_data)
+        invalidate_cache("recent_documents", "tags_list")
         return {
             "success": True,
             "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -497,77 +804,60 @@ def readwise_update_document(request: UpdateDocumentRequest) -> Dict[str, Any]:
 @mcp.tool(
     name="readwise_delete_document", 
     description="Delete a document from Readwise Reader. This action cannot be undone!",
-    annotations=ToolAnnotations(
-        title="Delete Reader Document",
-        readOnlyHint=False,
-        destructiveHint=True,  # Mark as destructive - cannot be undone
-        idempotentHint=True
-    ) if ToolAnnotations else None,
+    annotations=_tool_annotations("Delete Reader Document",
+                                  read_only=False, destructive=True),
     tags=["reader", "document", "delete", "destructive"]
 )
-def readwise_delete_document(request: DeleteDocumentRequest) -> Dict[str, Any]:
+async def readwise_delete_document(request: DeleteDocumentRequest) -> Dict[str, Any]:
     """Delete a document from Readwise Reader"""
     try:
-        response = get_client().delete_document(request.id)
+        response = await asyncio.to_thread(get_client().delete_document, request.id)
+        invalidate_cache("recent_documents", "tags_list")
         return {
             "success": True,
             "data": {"deleted": True, "id": request.id},
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool(
     name="readwise_list_tags",
-    description="Get all document tags from Readwise Reader (cached for 5 minutes to reduce API calls)",
-    annotations=ToolAnnotations(
-        title="List Document Tags",
-        readOnlyHint=True,
-        destructiveHint=False,
-        idempotentHint=True
-    ) if ToolAnnotations else None,
+    description="Get all document tags from Readwise Reader (cached for 1 hour; refreshed immediately after document changes)",
+    annotations=_tool_annotations("List Document Tags"),
     tags=["reader", "tags", "metadata", "cached"]
 )
-def readwise_list_tags() -> Dict[str, Any]:
-    """Get all document tags from Readwise Reader (cached for 5 minutes to reduce API calls)"""
+async def readwise_list_tags() -> Dict[str, Any]:
+    """Get all document tags from Readwise Reader (cached for 1 hour; refreshed immediately after document changes)"""
     try:
-        # Check cache first to avoid unnecessary API calls
-        cached_tags = get_cached("tags_list")
-        if cached_tags is not None:
-            return cached_tags
-            
-        response = get_client().list_tags()
-        result = {
+        shared = await _cached_fetch("tags_list", _fetch_all_tags)
+        return {
             "success": True,
-            "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "data": shared["tags"],
+            "messages": shared["messages"]
         }
-        
-        # Cache the result to reduce future API calls
-        set_cache("tags_list", result)
-        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_topic_search(request: TopicSearchRequest) -> Dict[str, Any]:
+async def readwise_topic_search(request: TopicSearchRequest) -> Dict[str, Any]:
     """Enhanced topic search across documents with AI-powered text processing"""
     try:
-        # Process search terms with wordninja for better matching
-        processed_terms = []
-        for term in request.searchTerms:
-            processed_term = process_with_wordninja(term)
-            processed_terms.append(processed_term)
-            # Also add original term
-            if processed_term != term:
-                processed_terms.append(term)
-        
-        response = get_client().search_documents_by_topic(processed_terms)
+        # Process search terms with wordninja for better matching, keeping the
+        # originals; dict.fromkeys dedups while preserving order so terms that
+        # segment to themselves aren't searched twice
+        processed_terms = list(dict.fromkeys(
+            variant
+            for term in request.searchTerms
+            for variant in (process_with_wordninja(term), term)
+        ))
+
+        response = await asyncio.to_thread(get_client().search_documents_by_topic, processed_terms)
         return {
             "success": True,
             "data": response.data,
             "searchTermsUsed": processed_terms,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -577,153 +867,206 @@ def readwise_topic_search(request: TopicSearchRequest) -> Dict[str, Any]:
 @mcp.tool(
     name="readwise_list_highlights", 
     description="List highlights with advanced filtering options. Use conservative limits to avoid hitting rate limits.",
-    annotations=ToolAnnotations(
-        title="List Highlights",
-        readOnlyHint=True,
-        destructiveHint=False,
-        idempotentHint=True
-    ) if ToolAnnotations else None,
+    annotations=_tool_annotations("List Highlights"),
     tags=["highlights", "list", "search", "reading"]
 )
-def readwise_list_highlights(request: ListHighlightsRequest) -> Dict[str, Any]:
+async def readwise_list_highlights(request: ListHighlightsRequest) -> Dict[str, Any]:
     """List highlights with advanced filtering options"""
     try:
-        params = {k: v for k, v in request.model_dump().items() if v is not None}
-        response = get_client().list_highlights(**params)
+        params = request.model_dump(exclude_none=True)
+
+        # Highlights change more often than books, so keep this TTL short;
+        # repeated identical pages within a session still skip the round-trip
+        cache_key = f"highlights_list_{sorted(params.items())}"
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await asyncio.to_thread(get_client().list_highlights, **params)
         
-        # Context-optimized response - only essential fields
+        # Context-optimized response - only essential fields; itemgetter pulls
+        # all four in one C call per highlight instead of four .get() probes.
+        # Built as a fresh dict so the full-size originals aren't kept alive
+        # through serialization just because the response dict references them
         if response.data.get('results'):
-            optimized_results = []
-            for highlight in response.data['results']:
-                optimized_highlight = {
-                    'id': highlight.get('id'),
-                    'text': highlight.get('text'),
-                    'note': highlight.get('note'),
-                    'book_id': highlight.get('book_id')
-                }
-                optimized_results.append(optimized_highlight)
-            response.data['results'] = optimized_results
-        
-        return {
+            data = {
+                'count': response.data.get('count'),
+                'next': response.data.get('next'),
+                'previous': response.data.get('previous'),
+                'results': [
+                    _highlight_row(highlight)
+                    for highlight in response.data['results']
+                ]
+            }
+        else:
+            data = response.data
+
+        result = {
             "success": True,
-            "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "data": data,
+            "messages": _dump_messages(response)
         }
+        set_cache(cache_key, result, ttl=120)
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_get_daily_review() -> Dict[str, Any]:
+async def readwise_get_daily_review() -> Dict[str, Any]:
     """Get daily review highlights for spaced repetition learning"""
     try:
-        response = get_client().get_daily_review()
-        return {
+        # The review set is fixed for the day, so a short TTL is safely stale-free
+        cached = get_cached("daily_review")
+        if cached is not None:
+            return cached
+
+        response = await asyncio.to_thread(get_client().get_daily_review)
+        result = {
             "success": True,
             "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
+        set_cache("daily_review", result, ttl=3600)
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_search_highlights(request: SearchHighlightsRequest) -> Dict[str, Any]:
+async def readwise_search_highlights(request: SearchHighlightsRequest) -> Dict[str, Any]:
     """Advanced search across highlights with field-specific queries and relevance scoring"""
     try:
-        # Convert camelCase to snake_case for the API
-        params = {}
-        if request.textQuery is not None:
-            params['text_query'] = request.textQuery
-        if request.fieldQueries is not None:
-            params['field_queries'] = request.fieldQueries
-        if request.bookId is not None:
-            params['book_id'] = request.bookId
-        if request.limit is not None:
-            params['limit'] = request.limit
-        
-        response = get_client().search_highlights(**params)
-        
+        # Serialization aliases map camelCase to the client's snake_case names
+        params = request.model_dump(by_alias=True, exclude_none=True)
+
+        # Identical queries recur within a session (retries, follow-ups); a
+        # short TTL skips the export crawl + rescoring on the repeat
+        params_digest = hashlib.blake2b(
+            repr(sorted(params.items())).encode(), digest_size=12
+        ).hexdigest()
+        cache_key = f"search_highlights_{params_digest}"
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await asyncio.to_thread(get_client().search_highlights, **params)
+
         # Context-optimized response
-        optimized_results = []
-        for result in response.data:
-            optimized_result = {
+        optimized_results = [
+            {
                 'text': result['highlight'].get('text'),
                 'book': result['book'].get('title'),
                 'author': result['book'].get('author'),
-                'score': result.get('score')
+                'score': result['score']
             }
-            optimized_results.append(optimized_result)
-        
-        return {
+            for result in response.data
+        ]
+
+        result = {
             "success": True,
             "data": optimized_results,
             "totalResults": len(response.data),
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
+        # Only non-empty results are cached: a miss may be a highlight that
+        # lands moments later, and caching it would hide the fresh answer
+        if optimized_results:
+            set_cache(cache_key, result, ttl=60)
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_list_books(request: ListBooksRequest) -> Dict[str, Any]:
+async def readwise_list_books(request: ListBooksRequest) -> Dict[str, Any]:
     """Get books with highlight metadata and filtering"""
     try:
-        params = {k: v for k, v in request.model_dump().items() if v is not None}
-        response = get_client().list_books(**params)
-        
-        # Context-optimized response - only essential fields
+        params = request.model_dump(exclude_none=True)
+
+        # Short TTL: the books list only changes when highlights are added,
+        # but repeated listing calls within a session are very common
+        cache_key = f"books_list_{sorted(params.items())}"
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await asyncio.to_thread(get_client().list_books, **params)
+
+        # Context-optimized response - only essential fields, built as a fresh
+        # dict so the full-size book payloads can be reclaimed immediately
         if response.data.get('results'):
-            optimized_results = []
-            for book in response.data['results']:
-                optimized_book = {
-                    'id': book.get('id'),
-                    'title': book.get('title'),
-                    'author': book.get('author'),
-                    'category': book.get('category'),
-                    'num_highlights': book.get('num_highlights')
-                }
-                optimized_results.append(optimized_book)
-            response.data['results'] = optimized_results
-        
-        return {
+            data = {
+                'count': response.data.get('count'),
+                'next': response.data.get('next'),
+                'previous': response.data.get('previous'),
+                'results': [
+                    _book_row(book)
+                    for book in response.data['results']
+                ]
+            }
+        else:
+            data = response.data
+
+        result = {
             "success": True,
-            "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "data": data,
+            "messages": _dump_messages(response)
         }
+        set_cache(cache_key, result, ttl=30)
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool(
     name="readwise_find_book_id",
     description="Find the best matching book ID by title",
-    annotations=ToolAnnotations(
-        title="Find Book ID",
-        readOnlyHint=True,
-        destructiveHint=False,
-        idempotentHint=True
-    ) if ToolAnnotations else None,
+    annotations=_tool_annotations("Find Book ID"),
     tags=["books", "search", "highlights"]
 )
-def readwise_find_book_id(request: FindBookIdRequest) -> Dict[str, Any]:
+async def readwise_find_book_id(request: FindBookIdRequest) -> Dict[str, Any]:
     """Find a book by title and return its ID and minimal metadata"""
     try:
-        response = get_client().list_books(search=request.title, page_size=100)
+        # Title lookups repeat a lot within a session (find the book, then
+        # fetch its highlights); cache hits skip both the round-trip and the
+        # fuzzy scoring. Keyed on the normalized title
+        cache_key = f"find_book_{request.title.lower().strip()}"
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await asyncio.to_thread(get_client().list_books, search=request.title, page_size=100)
         books = response.data.get('results', [])
         if not books:
-            return {"success": False, "error": "Book not found"}
-
-        target = request.title.lower()
-        best_book = None
-        best_ratio = 0.0
-        for book in books:
-            title = book.get('title', '').lower()
-            ratio = SequenceMatcher(None, target, title).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_book = book
+            # Negative cache: repeated typos within a session shouldn't each
+            # burn a round-trip. Short TTL so a book added moments later
+            # becomes findable quickly
+            not_found = {"success": False, "error": "Book not found"}
+            set_cache(cache_key, not_found, ttl=60)
+            return not_found
+
+        if _rf_process is not None:
+            # rapidfuzz scores all candidates in one C-level call, orders of
+            # magnitude faster than a difflib loop over 100 titles
+            titles = [book.get('title', '') for book in books]
+            match = _rf_process.extractOne(
+                request.title, titles, scorer=_rf_fuzz.WRatio, score_cutoff=40
+            )
+            best_book = books[match[2]] if match else None
+        else:
+            target = request.title.lower()
+            best_book = None
+            best_ratio = 0.0
+            for book in books:
+                title = book.get('title', '').lower()
+                ratio = SequenceMatcher(None, target, title).ratio()
+                if ratio > best_ratio:
+                    best_ratio = ratio
+                    best_book = book
 
         if not best_book:
-            return {"success": False, "error": "Book not found"}
+            not_found = {"success": False, "error": "Book not found"}
+            set_cache(cache_key, not_found, ttl=60)
+            return not_found
 
-        return {
+        result = {
             "success": True,
             "data": {
                 'id': best_book.get('id'),
@@ -731,50 +1074,105 @@ def readwise_find_book_id(request: FindBookIdRequest) -> Dict[str, Any]:
                 'author': best_book.get('author')
             }
         }
+        set_cache(cache_key, result, ttl=600)
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_get_book_highlights(request: GetBookHighlightsRequest) -> Dict[str, Any]:
+async def readwise_get_book_highlights(request: GetBookHighlightsRequest) -> Dict[str, Any]:
     """Get all highlights from a specific book"""
     try:
-        response = get_client().get_book_highlights(request.bookId)
+        response = await asyncio.to_thread(get_client().get_book_highlights, request.bookId)
         return {
             "success": True,
             "data": response.data,
             "bookId": request.bookId,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_export_highlights(request: ExportHighlightsRequest) -> Dict[str, Any]:
+async def readwise_export_highlights(request: ExportHighlightsRequest) -> Dict[str, Any]:
     """Bulk export highlights for analysis and backup"""
     try:
-        params = {k: v for k, v in request.model_dump().items() if v is not None}
-        response = get_client().export_highlights(**params)
+        params = request.model_dump(exclude_none=True)
+        max_pages = params.pop('maxPages', 1) or 1
+        export = get_client().export_highlights
+
+        response = await asyncio.to_thread(export, **params)
+        # Copy before extending: the list belongs to the client's cached
+        # response, and extending it in place would grow the cached entry
+        # on every repeat call within the TTL
+        results = list(response.data.get('results', []))
+        next_cursor = response.data.get('nextPageCursor')
+        pages_fetched = 1
+
+        # Follow the cursor here so bulk exports come back merged in one tool
+        # call instead of the MCP client paying a round-trip per page
+        while next_cursor and pages_fetched < max_pages:
+            params['pageCursor'] = next_cursor
+            page = await asyncio.to_thread(export, **params)
+            results.extend(page.data.get('results', []))
+            next_cursor = page.data.get('nextPageCursor')
+            pages_fetched += 1
+
+        data = dict(response.data)
+        data['results'] = results
+        data['nextPageCursor'] = next_cursor
+
         return {
             "success": True,
-            "data": response.data,
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "data": data,
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 @mcp.tool
-def readwise_create_highlight(request: CreateHighlightRequest) -> Dict[str, Any]:
+async def readwise_create_highlight(request: CreateHighlightRequest) -> Dict[str, Any]:
     """Manually add highlights with full metadata support"""
     try:
-        response = get_client().create_highlight(request.highlights)
+        client = get_client()
+        highlights = request.highlights
+
+        if len(highlights) <= 100:
+            response = await asyncio.to_thread(client.create_highlight, highlights)
+            data = response.data
+        else:
+            # Large imports: chunk to stay under the endpoint's payload cap
+            # and overlap the POSTs, bounded so a 1000-highlight import
+            # doesn't monopolize the connection pool
+            chunks = [highlights[i:i + 100] for i in range(0, len(highlights), 100)]
+            semaphore = asyncio.Semaphore(8)
+
+            async def post_chunk(chunk):
+                async with semaphore:
+                    return await asyncio.to_thread(client.create_highlight, chunk)
+
+            responses = await asyncio.gather(*[post_chunk(chunk) for chunk in chunks])
+            data = []
+            for chunk_response in responses:
+                if isinstance(chunk_response.data, list):
+                    data.extend(chunk_response.data)
+                else:
+                    data.append(chunk_response.data)
+            response = responses[-1]
+
+        # New highlights change book listings, per-book highlights and searches
+        invalidate_cache("books_", "book_highlights_", "search_books_", "highlights_list_", "find_book_", "search_highlights_")
         return {
             "success": True,
-            "data": response.data,
-            "created_count": len(request.highlights),
-            "messages": [{"type": msg.type, "content": msg.content} for msg in (response.messages or [])]
+            "data": data,
+            "created_count": len(highlights),
+            "messages": _dump_messages(response)
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 if __name__ == "__main__":
+    # Pre-warm the wordninja model in the background so the first tool call
+    # that needs segmentation doesn't pay the load, without blocking startup
+    threading.Thread(target=lambda: _wordninja().split('warmup'), daemon=True).start()
     mcp.run()
\ No newline at end of file
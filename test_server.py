@@ -4,8 +4,43 @@ Simple test script for the Readwise MCP server
 """
 
 import asyncio
+import server
 from server import mcp
 
+class _StubExportClient:
+    """Stub client that, like the real one, hands back the same cached
+    response object for repeated export calls"""
+    def __init__(self):
+        from readwise_client import APIResponse
+        self._responses = {
+            None: APIResponse(data={'results': [{'id': 1}], 'nextPageCursor': 'c2'}, messages=[]),
+            'c2': APIResponse(data={'results': [{'id': 2}], 'nextPageCursor': None}, messages=[]),
+        }
+
+    def export_highlights(self, **params):
+        return self._responses[params.get('pageCursor')]
+
+async def test_export_merge():
+    """Repeated multi-page exports must not grow the cached page in place"""
+    server.client = _StubExportClient()
+    try:
+        export_tool = server.readwise_export_highlights
+        export_fn = getattr(export_tool, 'fn', export_tool)
+        request = server.ExportHighlightsRequest(maxPages=2)
+
+        first = await export_fn(request)
+        second = await export_fn(request)
+
+        assert len(first['data']['results']) == 2, first
+        assert len(second['data']['results']) == 2, second
+        print("✅ Repeated multi-page export returns stable results!")
+        return True
+    except Exception as e:
+        print(f"❌ Export merge regression: {e}")
+        return False
+    finally:
+        server.client = None
+
 async def test_server():
     print(f"Server name: {mcp.name}")
     
@@ -30,6 +65,9 @@ async def test_server():
         print(f"❌ Error testing server: {e}")
         return False
 
+async def main():
+    return await test_server() and await test_export_merge()
+
 if __name__ == "__main__":
-    success = asyncio.run(test_server())
+    success = asyncio.run(main())
     exit(0 if success else 1)
\ No newline at end of file